@@ -8,7 +8,7 @@ One reading per minute saved to CSV
 import serial
 import time
 import os
-import csv
+import select
 import threading
 import logging
 from datetime import datetime
@@ -22,9 +22,13 @@ import os
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DGS2_CSV_FILENAME = os.path.join(BASE_DIR, 'data', 'dgs2_readings.csv')
-READ_INTERVAL = 10  # seconds between individual reads
+READ_INTERVAL = 10  # seconds between buffered samples
 BUFFER_INTERVAL = 60  # aggregate every 60 seconds
 BUFFER_SIZE = 6  # 60 seconds / 10 seconds = 6 readings per minute
+SERIAL_POLL_TIMEOUT = 2  # seconds to wait for serial data before re-checking is_running
+SERIAL_READ_CHUNK = 4096  # drain everything queued in one os.read() call
+SERIAL_LINE_MAX = 4096  # discard partial input that never terminates
+CSV_HEADER = 'timestamp,ppb,temperature,humidity\r\n'  # csv module's default line terminator
 
 # Logging
 logging.basicConfig(
@@ -47,12 +51,18 @@ class DGS2Sensor:
         self.ser = None
         self.is_running = False
         self.thread = None
+        self.csv_thread = None
         self.lock = threading.Lock()
 
         # Buffer for readings (60 seconds)
         self.buffer = deque(maxlen=BUFFER_SIZE)
         self.last_valid_reading = None
 
+        # Aggregation and CSV writes run on a separate thread so the
+        # serial reader only ever drains the UART into the buffer
+        self._stop_event = threading.Event()
+        self._csv_file = None
+
     def connect(self) -> bool:
         """Connect to serial port"""
         try:
@@ -65,11 +75,30 @@ class DGS2Sensor:
                 timeout=2
             )
             logger.info(f"✓ Connected to {self.port} at {self.baudrate} baud")
+            self._enable_low_latency()
             return True
         except serial.SerialException as e:
             logger.error(f"✗ Failed to connect to serial port {self.port}: {e}")
             return False
 
+    def _enable_low_latency(self) -> None:
+        """Cut the USB-serial latency timer (FTDI defaults to 16 ms)"""
+        tty = os.path.basename(os.path.realpath(self.port))
+        try:
+            with open(f'/sys/bus/usb-serial/devices/{tty}/latency_timer', 'w') as f:
+                f.write('1')
+            logger.debug("Set %s latency timer to 1 ms", tty)
+            return
+        except OSError:
+            pass
+
+        # Fall back to the ASYNC_LOW_LATENCY serial flag (Linux only)
+        try:
+            self.ser.set_low_latency_mode(True)
+            logger.debug("Enabled low-latency mode on %s", tty)
+        except (AttributeError, NotImplementedError, ValueError, OSError) as e:
+            logger.warning(f"Could not enable low-latency serial mode: {e}")
+
     def disconnect(self) -> None:
         """Close serial connection"""
         if self.ser and self.ser.is_open:
@@ -92,33 +121,44 @@ class DGS2Sensor:
         except serial.SerialException as e:
             logger.error(f"Failed to send command: {e}")
 
-    def parse_reading(self, line: str) -> Optional[Dict]:
+    def parse_reading(self, line: bytes) -> Optional[Dict]:
         """
-        Parse sensor output line
+        Parse raw sensor output line
         Format: sensor_sn, ppb, temperature, humidity, adc_gas, adc_temp, adc_hum
         """
-        try:
-            parts = [p.strip() for p in line.split(',')]
-
-            if len(parts) != 7:
-                return None
+        # Slice the seven fields out directly instead of building a list;
+        # float()/int() accept bytes and ignore surrounding whitespace
+        find = line.find
+        i0 = find(b',')
+        i1 = find(b',', i0 + 1)
+        i2 = find(b',', i1 + 1)
+        i3 = find(b',', i2 + 1)
+        i4 = find(b',', i3 + 1)
+        i5 = find(b',', i4 + 1)
+
+        if i0 < 0 or i5 < 0 or find(b',', i5 + 1) >= 0:
+            return None
 
-            sensor_sn, ppb_str, temp_str, hum_str, adc_gas_str, adc_temp_str, adc_hum_str = parts
+        # Serial numbers are plain ASCII alphanumerics; anything else is line noise
+        sensor_sn = line[:i0].strip()
+        if not sensor_sn.isalnum():
+            return None
 
+        try:
             # Temperature and humidity are scaled by 100
             reading = {
-                'timestamp': datetime.utcnow().isoformat() + 'Z',
-                'sensor_sn': sensor_sn,
-                'ppb': float(ppb_str),
-                'temperature': float(temp_str) / 100.0,
-                'humidity': float(hum_str) / 100.0,
-                'adc_gas': int(adc_gas_str),
-                'adc_temp': int(adc_temp_str),
-                'adc_hum': int(adc_hum_str)
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'sensor_sn': sensor_sn.decode('ascii'),
+                'ppb': float(line[i0 + 1:i1]),
+                'temperature': float(line[i1 + 1:i2]) / 100.0,
+                'humidity': float(line[i2 + 1:i3]) / 100.0,
+                'adc_gas': int(line[i3 + 1:i4]),
+                'adc_temp': int(line[i4 + 1:i5]),
+                'adc_hum': int(line[i5 + 1:])
             }
 
             return reading
-        except (ValueError, IndexError):
+        except ValueError:
             return None
 
     def get_average_reading(self) -> Optional[Dict]:
@@ -141,23 +181,53 @@ class DGS2Sensor:
         }
         return avg_reading
 
+    def _open_csv(self) -> None:
+        """Open the CSV file for appending and write the header if empty"""
+        self._csv_file = open(self.csv_filename, 'a', newline='', buffering=8192)
+
+        # Append mode starts at end of file, so position 0 means a new/empty log
+        if self._csv_file.tell() == 0:
+            self._csv_file.write(CSV_HEADER)
+
+    def _close_csv(self) -> None:
+        """Close the cached CSV file handle"""
+        try:
+            if self._csv_file:
+                self._csv_file.close()
+        except OSError as e:
+            # close() flushes; a full or failing disk must not escape here
+            logger.error("Failed to close CSV file: %s", e)
+        finally:
+            self._csv_file = None
+
     def log_to_csv(self, data: Dict) -> None:
         """Log sensor data to CSV file"""
         try:
-            file_exists = os.path.isfile(self.csv_filename)
+            # Reopen if the log was deleted underneath us (e.g. via the API)
+            if self._csv_file and os.fstat(self._csv_file.fileno()).st_nlink == 0:
+                self._close_csv()
 
-            with open(self.csv_filename, 'a', newline='') as csvfile:
-                fieldnames = ['timestamp', 'ppb', 'temperature', 'humidity']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            if not self._csv_file:
+                self._open_csv()
 
-                if not file_exists:
-                    writer.writeheader()
-
-                csv_data = {k: data[k] for k in fieldnames if k in data}
-                writer.writerow(csv_data)
-            logger.info(f"📝 DGS2 reading saved: VOC={data['ppb']}ppb, T={data['temperature']}°C, H={data['humidity']}%")
+            # All fields are numeric or a fixed-format timestamp, so no quoting needed
+            self._csv_file.write(
+                f"{data['timestamp']},{data['ppb']},{data['temperature']},{data['humidity']}\r\n"
+            )
+            # One row per minute: flush so the API server sees it right away
+            self._csv_file.flush()
+            logger.info("📝 DGS2 reading saved: VOC=%sppb, T=%s°C, H=%s%%",
+                        data['ppb'], data['temperature'], data['humidity'])
         except Exception as e:
-            logger.error(f"Failed to log to CSV: {e}")
+            logger.error("Failed to log to CSV: %s", e)
+            self._close_csv()
+
+    def _csv_loop(self) -> None:
+        """Aggregation and CSV logging loop (runs in background thread)"""
+        while not self._stop_event.wait(BUFFER_INTERVAL):
+            avg = self.get_average_reading()
+            if avg:
+                self.log_to_csv(avg)
 
     def start(self) -> None:
         """Start reading sensor in background thread"""
@@ -169,58 +239,90 @@ class DGS2Sensor:
             return
 
         self.is_running = True
+        self._stop_event.clear()
         self.thread = threading.Thread(target=self._read_loop, daemon=True)
         self.thread.start()
+        self.csv_thread = threading.Thread(target=self._csv_loop, daemon=True)
+        self.csv_thread.start()
         logger.info("🚀 DGS2 reader started")
 
     def stop(self) -> None:
         """Stop reading sensor"""
         self.is_running = False
+        self._stop_event.set()
         if self.thread:
             self.thread.join(timeout=5)
+        if self.csv_thread:
+            self.csv_thread.join(timeout=5)
         self.disconnect()
+        self._close_csv()
         logger.info("⏹️  DGS2 reader stopped")
 
+    def _read_lines(self, poller, rx_buf: bytearray) -> list:
+        """Wait for serial data and return any complete lines received"""
+        if not poller.poll(SERIAL_POLL_TIMEOUT):
+            return []
+
+        try:
+            chunk = os.read(self.ser.fileno(), SERIAL_READ_CHUNK)
+        except BlockingIOError:
+            return []
+        if not chunk:
+            raise serial.SerialException("device reports readiness to read but returned no data")
+
+        rx_buf += chunk
+        lines = []
+        start = 0
+        while True:
+            end = rx_buf.find(b'\n', start)
+            if end < 0:
+                break
+            lines.append(bytes(rx_buf[start:end]))
+            start = end + 1
+        del rx_buf[:start]
+
+        if len(rx_buf) > SERIAL_LINE_MAX:
+            rx_buf.clear()
+        return lines
+
     def _read_loop(self) -> None:
         """Main reading loop (runs in background thread)"""
         # Start continuous mode
         self.send_command('C')
         time.sleep(1)
 
-        last_buffer_flush = time.time()
+        last_sample = time.monotonic() - READ_INTERVAL
+
+        # Wait on the serial fd directly and read whole bursts instead of
+        # letting pyserial's readline() fetch one byte at a time
+        poller = select.epoll()
+        poller.register(self.ser.fileno(), select.EPOLLIN)
+        rx_buf = bytearray()
 
         while self.is_running:
+            # Only the read itself can fail; parse_reading handles bad lines
             try:
-                if self.ser.in_waiting > 0:
-                    line = self.ser.readline().decode('utf-8').strip()
-
-                    if line:
-                        reading = self.parse_reading(line)
-
-                        if reading:
-                            with self.lock:
-                                self.buffer.append(reading)
-                                self.last_valid_reading = reading
-
-                # Check if 60 seconds have passed
-                current_time = time.time()
-                if current_time - last_buffer_flush >= BUFFER_INTERVAL:
-                    avg = self.get_average_reading()
-                    if avg:
-                        self.log_to_csv(avg)
-                    last_buffer_flush = current_time
-
-                time.sleep(READ_INTERVAL)
-
-            except serial.SerialException as e:
-                logger.error(f"Serial read error: {e}")
+                lines = self._read_lines(poller, rx_buf)
+            except (serial.SerialException, OSError) as e:
+                logger.error("Serial read error: %s", e)
                 if self.is_running:
                     time.sleep(1)
-            except UnicodeDecodeError:
-                pass
-            except Exception as e:
-                logger.error(f"Error in read loop: {e}")
-                time.sleep(1)
+                continue
+
+            for line in lines:
+                reading = self.parse_reading(line)
+
+                if reading:
+                    current_time = time.monotonic()
+                    with self.lock:
+                        self.last_valid_reading = reading
+                        # Continuous mode streams faster than we aggregate,
+                        # so only sample one reading per READ_INTERVAL
+                        if current_time - last_sample >= READ_INTERVAL:
+                            self.buffer.append(reading)
+                            last_sample = current_time
+
+        poller.close()
 
     def get_latest_reading(self) -> Optional[Dict]:
         """Get the latest raw reading"""